@@ -306,14 +306,7 @@ def _az_connect_core(
         )
 
     # Filter and replace error message when credentials not found
-    azure_identity_logger = logging.getLogger("azure.identity")
-    handler = logging.StreamHandler(sys.stdout)
-    if silent:
-        handler.addFilter(_filter_all_warnings)
-    else:
-        handler.addFilter(_filter_credential_warning)
-    azure_identity_logger.setLevel(logging.WARNING)
-    azure_identity_logger.handlers = [handler]
+    _install_identity_logger_handler(silent)
 
     # Connect to the subscription client to validate
     legacy_creds = CredentialWrapper(creds, resource_id=az_config.token_uri)
@@ -443,6 +436,21 @@ def _filter_all_warnings(record) -> bool:
     return True
 
 
+def _install_identity_logger_handler(silent: bool):
+    """Install the azure.identity warning-filter handler, once per mode."""
+    azure_identity_logger = logging.getLogger("azure.identity")
+    log_filter = _filter_all_warnings if silent else _filter_credential_warning
+    # avoid re-installing an identical handler on every authentication call
+    if any(
+        log_filter in handler.filters for handler in azure_identity_logger.handlers
+    ):
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(log_filter)
+    azure_identity_logger.setLevel(logging.WARNING)
+    azure_identity_logger.handlers = [handler]
+
+
 class AzureCliStatus(Enum):
     """Enumeration for _check_cli_credentials return values."""
 
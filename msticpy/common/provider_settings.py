@@ -7,7 +7,8 @@
 import os
 import warnings
 from collections import UserDict
-from typing import Any, Callable, Dict, List, Optional, Union
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import attr
 from attr import Factory
@@ -112,6 +113,12 @@ _SET_SECRETS_CLIENT: Callable[
 if get_config("KeyVault", None) and _SECRETS_ENABLED:
     _SECRETS_CLIENT = _SET_SECRETS_CLIENT()
 
+# Cache of built provider settings, keyed by config section name.
+# A snapshot of the raw section is stored alongside the result so that
+# any change to the section - a rebuilt config (refresh_config) or an
+# in-place update (set_config) - invalidates the cached entry.
+_PROVIDER_SETTINGS_CACHE: Dict[str, Tuple[Any, Dict[str, ProviderSettings]]] = {}
+
 
 def get_provider_settings(config_section="TIProviders") -> Dict[str, ProviderSettings]:
     """
@@ -143,6 +150,15 @@ def get_provider_settings(config_section="TIProviders") -> Dict[str, ProviderSet
     if not section_settings:
         return {}
 
+    # Re-use previously-built settings while the underlying config
+    # section is unchanged. Comparing against the cached snapshot
+    # catches both config rebuilds and in-place set_config updates.
+    cached_section, cached_settings = _PROVIDER_SETTINGS_CACHE.get(
+        config_section, (None, None)
+    )
+    if cached_section == section_settings:
+        return cached_settings
+
     settings = {}
     for provider, item_settings in section_settings.items():
         prov_args = item_settings.get("Args")
@@ -159,12 +175,17 @@ def get_provider_settings(config_section="TIProviders") -> Dict[str, ProviderSet
         )
         settings[provider] = prov_settings
 
+    _PROVIDER_SETTINGS_CACHE[config_section] = (
+        deepcopy(section_settings),
+        settings,
+    )
     return settings
 
 
 def reload_settings():
     """Reload settings from config files."""
     refresh_config()
+    _PROVIDER_SETTINGS_CACHE.clear()
 
 
 def refresh_keyring():
@@ -4,6 +4,7 @@
 # license information.
 # --------------------------------------------------------------------------
 """Mixin Classes for Sentinel Incident Features."""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 from uuid import UUID, uuid4
@@ -68,17 +69,27 @@ class SentinelIncidentsMixin:
 
         incident_df = _azs_api_result_to_df(response)
 
-        if entities:
-            incident_df["Entities"] = [self.get_entities(incident_id)]
-
-        if alerts:
-            incident_df["Alerts"] = [self.get_incident_alerts(incident_id)]
-
-        if comments:
-            incident_df["Bookmarks"] = [self.get_incident_comments(incident_id)]
-
-        if bookmarks:
-            incident_df["Bookmarks"] = [self.get_incident_bookmarks(incident_id)]
+        sub_item_fetchers = {
+            "Entities": (entities, self.get_entities),
+            "Alerts": (alerts, self.get_incident_alerts),
+            "Comments": (comments, self.get_incident_comments),
+            "Bookmarks": (bookmarks, self.get_incident_bookmarks),
+        }
+        requested = {
+            name: fetcher
+            for name, (flag, fetcher) in sub_item_fetchers.items()
+            if flag
+        }
+        if requested:
+            # each sub-item is an independent API round-trip - fetch
+            # the requested ones concurrently
+            with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+                futures = {
+                    name: executor.submit(fetcher, incident_id)
+                    for name, fetcher in requested.items()
+                }
+                for name, future in futures.items():
+                    incident_df[name] = [future.result()]
 
         return incident_df
 
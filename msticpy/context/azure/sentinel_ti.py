@@ -418,10 +418,11 @@ class SentinelTIMixin:
 
 def _build_additional_indicator_items(**kwargs) -> dict:
     """Add in additional data items for indicators."""
+    time_now = datetime.now().isoformat()
     data_items = {
         "validFrom": kwargs["valid_from"].isoformat()
         if "valid_from" in kwargs
-        else datetime.now().isoformat()
+        else time_now
     }
     for item, value in kwargs.items():
         if item in _INDICATOR_ITEMS:
@@ -429,7 +430,7 @@ def _build_additional_indicator_items(**kwargs) -> dict:
     if "valid_to" in kwargs:
         data_items["validUntil"] = kwargs["valid_to"].isoformat()
     else:
-        data_items["validUntil"] = datetime.now().isoformat()
+        data_items["validUntil"] = time_now
     if "external_references" in kwargs:
         ext_refs = [
             {"sourceName": "MSTICPy", "url": ref}
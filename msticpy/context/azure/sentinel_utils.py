@@ -92,12 +92,14 @@ class SentinelUtilsMixin:
             params = {}
         params["api-version"] = api_version
         response = self._get_items(item_url, params)
-        if response.status_code == 200:
-            results_df = _azs_api_result_to_df(response)
-        else:
+        if response.status_code != 200:
             raise CloudError(response=response)
+        # decode each page's JSON payload once - it is needed both for
+        # the result frame and for the nextLink
         j_resp = response.json()
-        results = [results_df]
+        if not j_resp:
+            raise ValueError("No valid JSON result in response")
+        results = [_json_result_to_df(j_resp)]
         # If nextLink in response, go get that data as well
         if next_follow:
             i = 0
@@ -105,9 +107,12 @@ class SentinelUtilsMixin:
             while "nextLink" in j_resp and i < 5:
                 next_url = j_resp["nextLink"]
                 next_response = self._get_items(next_url, params)
-                next_results_df = _azs_api_result_to_df(next_response)
-                results.append(next_results_df)
+                if next_response.status_code != 200:
+                    raise CloudError(response=next_response)
                 j_resp = next_response.json()
+                if not j_resp:
+                    raise ValueError("No valid JSON result in response")
+                results.append(_json_result_to_df(j_resp))
                 i += 1
         return pd.concat(results)
 
@@ -249,7 +254,12 @@ def _azs_api_result_to_df(response: httpx.Response) -> pd.DataFrame:
     j_resp = response.json()
     if response.status_code != 200 or not j_resp:
         raise ValueError("No valid JSON result in response")
-    if "value" in j_resp:
+    return _json_result_to_df(j_resp)
+
+
+def _json_result_to_df(j_resp: Any) -> pd.DataFrame:
+    """Convert an API JSON response body to a Pandas dataframe."""
+    if isinstance(j_resp, dict) and "value" in j_resp:
         j_resp = j_resp["value"]
     return pd.json_normalize(j_resp)
 
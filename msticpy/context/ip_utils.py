@@ -27,7 +27,8 @@ from deprecated.sphinx import deprecated
 
 from .._version import VERSION
 from ..common.exceptions import MsticpyConnectionError, MsticpyException
-from ..common.utility import arg_to_list, export
+from ..common.settings import get_http_timeout
+from ..common.utility import arg_to_list, export, mp_ua_header
 from ..datamodel.entities import GeoLocation, IpAddress
 
 __version__ = VERSION
@@ -562,6 +563,12 @@ def get_asn_from_ip(
     return {key.strip(): value.strip() for key, value in zip(keys, values)}
 
 
+@lru_cache(maxsize=1)
+def _get_rdap_client() -> httpx.Client:
+    """Return a shared httpx client with pooled connections for RDAP queries."""
+    return httpx.Client(timeout=get_http_timeout(), headers=mp_ua_header())
+
+
 class _IpWhoIsResult(NamedTuple):
     """Named tuple for IPWhoIs Result."""
 
@@ -612,7 +619,7 @@ def _add_rdap_data(
             for link in rdap_data_content["links"]:
                 if link["rel"] == "up":
                     up_data_link = link["href"]
-                    up_rdap_data = httpx.get(up_data_link)
+                    up_rdap_data = _get_rdap_client().get(up_data_link)
                     up_rdap_data_content = up_rdap_data.json()
                     up_net = _create_net(up_rdap_data_content)
                     ipwhois_result.properties["nets"].append(up_net)
@@ -632,7 +639,7 @@ def _rdap_lookup(url: str, retry_count: int = 5) -> httpx.Response:
     rdap_data = None
     while retry_count > 0 and not rdap_data:
         try:
-            rdap_data = httpx.get(url)
+            rdap_data = _get_rdap_client().get(url)
         except (httpx.WriteError, httpx.ReadError):
             retry_count -= 1
     if not rdap_data:
@@ -753,6 +760,7 @@ def _parse_asn_response(response) -> dict:
     return response_output
 
 
+@lru_cache(maxsize=1024)
 def _asn_results(asn: str) -> dict:
     """Get ASN details from ASN number."""
     if not asn.startswith("AS"):
@@ -330,7 +330,7 @@ class VTLookup:
 
         # return as a list of dictionaries or a DataFrame
         if output == "dict":
-            list_res = self.results.apply(lambda x: x.to_dict(), axis=1).tolist()
+            list_res = self.results.to_dict(orient="records")
             return list_res[0] if len(list_res) == 1 else list_res
 
         return self.results
@@ -500,6 +500,7 @@ class VTLookup:
             observables = [observable]
 
         # pylint: disable=consider-using-enumerate
+        parsed_frames = []
         for result_idx in range(len(results_to_parse)):
             df_dict_vtresults = self._parse_single_result(
                 results_to_parse[result_idx], ioc_type
@@ -535,11 +536,14 @@ class VTLookup:
                     observables[result_idx]
                 ]
 
-            new_results = pd.concat(
-                objs=[self.results, df_dict_vtresults], ignore_index=True, axis=0
-            )
+            parsed_frames.append(df_dict_vtresults)
 
-            self.results = new_results
+        if parsed_frames:
+            # concatenate all new results in one operation rather than
+            # rebuilding the results frame once per parsed result
+            self.results = pd.concat(
+                objs=[self.results, *parsed_frames], ignore_index=True, axis=0
+            )
         # pylint enable=locally-disabled, C0200
 
     def _parse_single_result(
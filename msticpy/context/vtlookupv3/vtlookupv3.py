@@ -963,17 +963,17 @@ class VTLookupV3:
             A DataFrame with the attributes of the virus total object
 
         """
-        # loop to convert from list of vt.Object to pd.DataFrame
-        response_rows = []
-        for response_item in response_list:
-            # flatten nested dictionary and append id, type values
-            response_item_df = pd.json_normalize(response_item["attributes"])
-            response_item_df["id"] = response_item["id"]
-            response_item_df["type"] = response_item["type"]
-
-            response_rows.append(response_item_df)
-
-        response_df = pd.concat(response_rows, axis=0, ignore_index=True)
+        # flatten nested attribute dictionaries and append id, type values,
+        # normalizing the full batch in a single pass
+        response_rows = [
+            dict(
+                response_item["attributes"],
+                id=response_item["id"],
+                type=response_item["type"],
+            )
+            for response_item in response_list
+        ]
+        response_df = pd.json_normalize(response_rows)
         return timestamps_to_utcdate(response_df)
 
     @staticmethod
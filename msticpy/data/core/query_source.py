@@ -6,6 +6,7 @@
 """Intake kql driver."""
 import json
 import re
+from functools import cached_property
 
 # from collections import ChainMap
 from datetime import datetime, timedelta, timezone
@@ -331,21 +332,21 @@ class QuerySource:
                     out_dict[param] = value
         return out_dict
 
+    @cached_property
+    def _param_aliases(self) -> Dict[str, str]:
+        """Return mapping of parameter alias to parameter name."""
+        alias_map: Dict[str, str] = {}
+        for p_name, p_props in self.params.items():
+            aliases = p_props.get("aliases")
+            if isinstance(aliases, str):
+                aliases = [aliases]
+            for alias in aliases or []:
+                alias_map.setdefault(alias, p_name)
+        return alias_map
+
     def _get_aliased_param(self, alias: str) -> Optional[str]:
         """Return first parameter with a matching alias."""
-        aliased_params = {
-            p_name: p_prop
-            for p_name, p_prop in self.params.items()
-            if "aliases" in p_prop
-        }
-        return next(
-            (
-                param
-                for param, props in aliased_params.items()
-                if alias in props["aliases"]
-            ),
-            None,
-        )
+        return self._param_aliases.get(alias)
 
     @classmethod
     def _calc_timeoffset(cls, time_offset: str) -> datetime:
@@ -442,16 +442,13 @@ def mask_df(  # noqa: MC0001
         map_func = MAP_FUNCS.get(col_type)
         try:
             if map_func == "null":
-                data[col_name] = None
+                out_df[col_name] = None
             elif map_func is not None and callable(map_func):
-                out_df[col_name] = out_df.apply(
-                    lambda x, col=col_name, func=map_func: func(x[col]), axis=1
-                )
+                # apply over the single column rather than row-wise over
+                # the whole frame
+                out_df[col_name] = out_df[col_name].apply(map_func)
             else:
-                out_df[col_name] = out_df.apply(
-                    lambda x, col=col_name, c_type=col_type: hash_item(x[col], c_type),
-                    axis=1,
-                )
+                out_df[col_name] = out_df[col_name].apply(hash_item, delim=col_type)
         except Exception as err:
             print(col_name, err)
             raise
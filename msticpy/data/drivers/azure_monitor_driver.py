@@ -61,6 +61,11 @@ except ImportError as imp_err:
 __version__ = VERSION
 __author__ = "Ian Hellen"
 
+# post v1.1.0 of azure-monitor-query, the API version requires a 'v1' suffix
+# parse the package version once rather than on each url_endpoint access
+_AZ_MONITOR_API_SUFFIX = (
+    "v1" if parse_version(az_monitor_version) > parse_version("1.1.0") else ""
+)
 
 _KQL_CLOUD_MAP = {"global": "public", "cn": "china", "usgov": "government"}
 
@@ -147,10 +152,7 @@ class AzureMonitorDriver(DriverBase):
     def url_endpoint(self) -> str:
         """Return the current URL endpoint for Azure Monitor."""
         base_url = self.az_cloud_config.log_analytics_uri
-        # post v1.1.0 of azure-monitor-query, the API version requires a 'v1' suffix
-        if parse_version(az_monitor_version) > parse_version("1.1.0"):
-            return f"{base_url}v1"
-        return base_url
+        return f"{base_url}{_AZ_MONITOR_API_SUFFIX}"
 
     @property
     def current_connection(self) -> str:
@@ -8,7 +8,7 @@ import datetime as dt
 import json
 import logging
 import re
-from asyncio import as_completed, Future
+from asyncio import Future
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial, singledispatch
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -63,6 +63,9 @@ class CybereasonDriver(DriverBase):
             Max is 10,000.
         page_size : int
             Number of results to return per page. Defaults to 100
+        pool_size : int
+            Number of HTTP connections to pool for paginated
+            queries. Defaults to 20
 
         Returns
         -------
@@ -88,11 +91,22 @@ class CybereasonDriver(DriverBase):
             "customFields": [],
         }
         self.search_endpoint: str = "/rest/visualsearch/query/simple"
+        # Parsed form of the last query produced by _custom_param_handler,
+        # so that query() does not have to re-parse the JSON it just built.
+        self._parsed_query: Optional[Tuple[str, Dict[str, Any]]] = None
         self._loaded = True
+        pool_size = kwargs.get("pool_size", 20)
+        logger.debug("Set connection pool size to %d", pool_size)
         self.client = httpx.Client(
             follow_redirects=True,
             timeout=self.get_http_timeout(timeout=timeout, def_timeout=120),
             headers=mp_ua_header(),
+            # keep enough connections alive to serve the paginated
+            # queries issued concurrently by _exec_paginated_queries
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
         )
         self.set_driver_property(
             DriverProps.FORMATTERS,
@@ -135,7 +149,10 @@ class CybereasonDriver(DriverBase):
 
         page_size = min(kwargs.get("page_size", 2000), 4000)
         logger.debug("Set page size to %d", page_size)
-        json_query = json.loads(query)
+        if self._parsed_query and self._parsed_query[0] == query:
+            json_query = self._parsed_query[1]
+        else:
+            json_query = json.loads(query)
         body = {**self.req_body, **json_query}
 
         # The query must be executed at least once to retrieve the number
@@ -377,8 +394,9 @@ class CybereasonDriver(DriverBase):
         total_results: int,
     ) -> Dict[str, partial]:
         """Return dictionary of partials to execute queries."""
-        # Compute the number of queries to execute
-        total_pages = total_results // page_size + 1
+        # Compute the number of queries to execute (ceiling division -
+        # avoids dispatching an empty extra page on exact multiples)
+        total_pages = -(-total_results // page_size)
         # The first query (page 0) as to be re-run due to a bug in
         # Cybereason API. The first query returns less results than the page size
         # when executed without a pagination token.
@@ -455,27 +473,32 @@ class CybereasonDriver(DriverBase):
         logger.info("Running %d threaded queries.", len(query_tasks))
         event_loop = _get_event_loop()
         with ThreadPoolExecutor(max_workers=4) as executor:
-            results: List[pd.DataFrame] = []
+            # Collect raw records per page and normalize the full batch
+            # in a single pass - per-page normalize + concat is much slower.
+            page_records: Dict[str, List[Dict[str, Any]]] = {}
             failed_tasks: Dict[str, Future] = {}
             thread_tasks = {
                 query_id: event_loop.run_in_executor(executor, query_func)
                 for query_id, query_func in query_tasks.items()
             }
+            # Await each task by its id - the tasks all run concurrently
+            # in the executor whatever the await order, and this keeps
+            # each page's records stored under the right page id.
+            # (asyncio.as_completed yields wrapper awaitables, not the
+            # original futures, so ids cannot be recovered from it.)
             if progress:
                 task_iter = tqdm(
-                    as_completed(thread_tasks.values()),
+                    thread_tasks.items(),
                     unit="paginated-queries",
                     desc="Running",
                 )
             else:
-                task_iter = as_completed(thread_tasks.values())
-            ids_and_tasks = dict(zip(thread_tasks, task_iter))
-            for query_id, thread_task in ids_and_tasks.items():
+                task_iter = thread_tasks.items()
+            for query_id, thread_task in task_iter:
                 try:
                     result = await thread_task
-                    df_result = self._format_result_to_dataframe(result)
                     logger.info("Query task '%s' completed successfully.", query_id)
-                    results.append(df_result)
+                    page_records[query_id] = self._flatten_result_records(result)
                 except Exception:  # pylint: disable=broad-except
                     logger.warning(
                         "Query task '%s' failed with exception", query_id, exc_info=True
@@ -487,17 +510,21 @@ class CybereasonDriver(DriverBase):
                     try:
                         logger.info("Retrying query task '%s'", query_id)
                         result = await thread_task
-                        df_result = self._format_result_to_dataframe(result)
-                        results.append(df_result)
+                        page_records[query_id] = self._flatten_result_records(result)
                     except Exception:  # pylint: disable=broad-except
                         logger.warning(
                             "Retried query task '%s' failed with exception",
                             query_id,
                             exc_info=True,
                         )
-            # Sort the results by the order of the tasks
-            results = [result for _, result in sorted(zip(thread_tasks, results))]
-        return pd.concat(results, ignore_index=True)
+            # Assemble the records in page order and normalize once.
+            # query ids are string page numbers - sort them numerically
+            all_records = [
+                record
+                for query_id in sorted(page_records, key=int)
+                for record in page_records[query_id]
+            ]
+        return pd.json_normalize(all_records)
 
     # pylint: disable=too-many-branches
     def query_with_results(self, query: str, **kwargs) -> Tuple[pd.DataFrame, Any]:
@@ -539,16 +566,20 @@ class CybereasonDriver(DriverBase):
             return timestamp
 
     @staticmethod
-    def _format_result_to_dataframe(result: Dict[str, Any]) -> pd.DataFrame:
-        """Return a dataframe from a cybereason result object."""
-        df_result = [
+    def _flatten_result_records(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return flattened result records from a cybereason result object."""
+        return [
             dict(
                 CybereasonDriver._flatten_result(values),
                 **{"resultId": result_id},
             )
             for result_id, values in result["data"]["resultIdToElementDataMap"].items()
         ]
-        return pd.json_normalize(df_result)
+
+    @staticmethod
+    def _format_result_to_dataframe(result: Dict[str, Any]) -> pd.DataFrame:
+        """Return a dataframe from a cybereason result object."""
+        return pd.json_normalize(CybereasonDriver._flatten_result_records(result))
 
     # Retrieve configuration parameters with aliases
     @staticmethod
@@ -579,12 +610,13 @@ class CybereasonDriver(DriverBase):
         # map names to allow for different spellings
         return CybereasonDriver._map_config_dict_name(app_config)
 
-    @staticmethod
-    def _custom_param_handler(query: str, param_dict: Dict[str, Any]) -> str:
+    def _custom_param_handler(self, query: str, param_dict: Dict[str, Any]) -> str:
         """Replace parameters in query template for Cybereason JSON queries."""
-        query_dict = json.loads(query)
-
-        return json.dumps(_recursive_find_and_replace(query_dict, param_dict))
+        query_dict = _recursive_find_and_replace(json.loads(query), param_dict)
+        query_str = json.dumps(query_dict)
+        # keep the parsed query so query() can skip re-parsing the string
+        self._parsed_query = (query_str, query_dict)
+        return query_str
 
 
 @singledispatch
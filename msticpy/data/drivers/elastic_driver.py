@@ -90,8 +90,10 @@ class ElasticDriver(DriverBase):
             cs_items = connection_str.split(";")
             cs_dict.update(
                 {
-                    cs_item.split("=")[0].strip(): cs_item.split("=")[1]
-                    for cs_item in cs_items
+                    key.strip(): value
+                    for key, _, value in (
+                        cs_item.partition("=") for cs_item in cs_items
+                    )
                 }
             )
         elif kwargs:
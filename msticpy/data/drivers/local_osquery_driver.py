@@ -287,8 +287,9 @@ class OSQueryLogDriver(DriverBase):
         list_lines: List[Dict[str, Any]] = []
         try:
             with open(log_path, mode="r", encoding="utf-8") as logfile:
-                json_lines = logfile.readlines()
-                list_lines = [json.loads(line) for line in json_lines]
+                # stream the lines rather than materializing the raw
+                # text of the whole file with readlines()
+                list_lines = [json.loads(line) for line in logfile]
 
         except (IOError, json.JSONDecodeError, ValueError) as exc:
             raise MsticpyDataQueryError(
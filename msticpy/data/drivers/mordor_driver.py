@@ -93,17 +93,18 @@ class MordorDriver(DriverBase):
         """
         global MITRE_TECHNIQUES, MITRE_TACTICS
         cache_folder = self.save_folder if self.use_cached else None
-        print("Retrieving Mitre data...")
-
+        # The Mordor fetch depends on the Mitre globals - resolve the
+        # Mitre data (from cache where possible) before starting it,
+        # otherwise _fetch_mdr_metadata falls back to an uncached
+        # Mitre download of its own.
         if MITRE_TECHNIQUES is None or MITRE_TACTICS is None:
+            print("Retrieving Mitre data...")
             MITRE_TECHNIQUES, MITRE_TACTICS = _get_mitre_categories(
                 cache_folder=cache_folder
             )
         self.mitre_techniques = MITRE_TECHNIQUES
         self.mitre_tactics = MITRE_TACTICS
-
         print("Retrieving Mordor data...")
-
         self.mordor_data = _GET_MORDOR_METADATA(cache_folder=cache_folder)
         self.mdr_idx_tech, self.mdr_idx_tact = _build_mdr_indexes(self.mordor_data)
 
@@ -620,7 +621,9 @@ def _fetch_mdr_metadata(cache_folder: Optional[str] = None) -> Dict[str, MordorE
     global MITRE_TECHNIQUES, MITRE_TACTICS
 
     if MITRE_TECHNIQUES is None or MITRE_TACTICS is None:
-        MITRE_TECHNIQUES, MITRE_TACTICS = _get_mitre_categories()
+        MITRE_TECHNIQUES, MITRE_TACTICS = _get_mitre_categories(
+            cache_folder=cache_folder
+        )
     md_metadata: Dict[str, MordorEntry] = {}
 
     md_cached_metadata = _read_mordor_cache(cache_folder)
@@ -802,13 +805,14 @@ def _extract_zip_file_to_df(  # noqa: MC0001
     if not use_cached or not file_path.is_file():
         zip_file.extract(file_name, path=save_folder)
 
-    out_df = pd.DataFrame()
-    if file_path.suffix.lower() == ".json":
+    suffix = file_path.suffix.lower()
+    if suffix == ".json":
         out_df = pd.read_json(file_path, lines=True)
-    if file_path.suffix.lower() == ".csv":
+    elif suffix == ".csv":
         out_df = pd.read_csv(file_path)
-    if file_path.suffix.lower() not in (".json", ".csv"):
-        print(f"Cannot process files of type {file_path.suffix.lower()}")
+    else:
+        print(f"Cannot process files of type {suffix}")
+        out_df = pd.DataFrame()
     if not use_cached:
         Path(file_name).unlink()
     return out_df
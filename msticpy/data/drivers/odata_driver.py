@@ -283,7 +283,7 @@ class OData(DriverBase):
         if not result:
             print("Warning - query did not return any results.")
             return None, json_response  # type: ignore
-        return pd.json_normalize(result), json_response
+        return _results_to_dataframe(result), json_response
 
     # pylint: enable=too-many-branches
 
@@ -345,6 +345,26 @@ class OData(DriverBase):
         return get_params
 
 
+def _results_to_dataframe(result: Any) -> pd.DataFrame:
+    """Convert a list of result records to a DataFrame."""
+    if (
+        isinstance(result, list)
+        and result
+        and all(
+            isinstance(record, dict)
+            and not any(
+                isinstance(value, (dict, list)) for value in record.values()
+            )
+            for record in result
+        )
+    ):
+        # all records flat - plain DataFrame construction is
+        # significantly faster than json_normalize. Records are not
+        # guaranteed homogeneous so every record must be checked.
+        return pd.DataFrame(result)
+    return pd.json_normalize(result)
+
+
 _CONFIG_NAME_MAP = {
     "tenant_id": ("tenantid", "tenant_id"),
     "client_id": ("clientid", "client_id"),
@@ -5,9 +5,11 @@
 #  --------------------------------------------------------------------------
 """Splunk Driver class."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from time import sleep
-from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 from tqdm import tqdm
@@ -39,6 +41,9 @@ __author__ = "Ashwin Patil, Tatsuya Hasegawa"
 
 logger = logging.getLogger(__name__)
 
+# translation table for normalizing saved-search names
+_UNDERSCORE_TRANS = str.maketrans(" ", "_")
+
 
 SPLUNK_CONNECT_ARGS = {
     "host": "(string) The host name (the default is 'localhost').",
@@ -79,6 +84,7 @@ class SplunkDriver(DriverBase):
         self.service = None
         self._loaded = True
         self._connected = False
+        self._saved_search_cache: Optional[list] = None
         if kwargs.get("debug", False):
             logger.setLevel(logging.DEBUG)
         self._required_params = self._SPLUNK_REQD_ARGS
@@ -150,13 +156,14 @@ class SplunkDriver(DriverBase):
                 help_uri="https://msticpy.readthedocs.io/en/latest/DataProviders.html",
             ) from err
         self._connected = True
+        self._saved_search_cache = None
         print("Connected.")
 
     def _get_connect_args(
         self, connection_str: Optional[str], **kwargs
     ) -> Dict[str, Any]:
         """Check and consolidate connection parameters."""
-        cs_dict: Dict[str, Any] = self._CONNECT_DEFAULTS
+        cs_dict: Dict[str, Any] = dict(self._CONNECT_DEFAULTS)
         # Fetch any config settings
         cs_dict.update(self._get_config_settings("Splunk"))
         # If a connection string - parse this and add to config
@@ -164,8 +171,10 @@ class SplunkDriver(DriverBase):
             cs_items = connection_str.split(";")
             cs_dict.update(
                 {
-                    cs_item.split("=")[0].strip(): cs_item.split("=")[1]
-                    for cs_item in cs_items
+                    key.strip(): value
+                    for key, _, value in (
+                        cs_item.partition("=") for cs_item in cs_items
+                    )
                 }
             )
         elif kwargs:
@@ -280,6 +289,9 @@ class SplunkDriver(DriverBase):
 
         if len(resp_rows) == 0 or not resp_rows:
             print("Warning - query did not return any results.")
+            if reader is None:
+                # async search with zero results - no pages were fetched
+                return []
             return [row for row in reader if isinstance(row, sp_results.Message)]
         return pd.DataFrame(resp_rows)
 
@@ -315,13 +327,7 @@ class SplunkDriver(DriverBase):
         """
         if not self.connected:
             raise self._create_not_connected_err("Splunk")
-        if hasattr(self.service, "saved_searches") and self.service.saved_searches:
-            queries = {
-                search.name.strip().replace(" ", "_"): f"search {search['search']}"
-                for search in self.service.saved_searches
-            }
-            return queries, "SavedSearches"
-        return {}, "SavedSearches"
+        return dict(self._saved_search_items()), "SavedSearches"
 
     @property
     def driver_queries(self) -> Iterable[Dict[str, Any]]:
@@ -342,17 +348,34 @@ class SplunkDriver(DriverBase):
         """
         if not self.connected:
             raise self._create_not_connected_err("Splunk")
-        if hasattr(self.service, "saved_searches") and self.service.saved_searches:
-            return [
-                {
-                    "name": search.name.strip().replace(" ", "_"),
-                    "query": f"search {search['search']}",
-                    "query_paths": "SavedSearches",
-                    "description": "",
-                }
-                for search in self.service.saved_searches
-            ]
-        return []
+        return [
+            {
+                "name": name,
+                "query": query,
+                "query_paths": "SavedSearches",
+                "description": "",
+            }
+            for name, query in self._saved_search_items()
+        ]
+
+    def _saved_search_items(self) -> List[Tuple[str, str]]:
+        """Return (name, query) pairs for the saved searches."""
+        return [
+            (
+                search.name.strip().translate(_UNDERSCORE_TRANS),
+                f"search {search['search']}",
+            )
+            for search in self._get_cached_saved_searches()
+        ]
+
+    def _get_cached_saved_searches(self) -> list:
+        """Return saved searches, fetching them once per connection."""
+        if self._saved_search_cache is None:
+            if hasattr(self.service, "saved_searches") and self.service.saved_searches:
+                self._saved_search_cache = list(self.service.saved_searches)
+            else:
+                self._saved_search_cache = []
+        return self._saved_search_cache
 
     def _exec_async_search(self, query_job, page_size, timeout):
         """Execute an async search and return results."""
@@ -392,10 +415,6 @@ class SplunkDriver(DriverBase):
             "event_count": int(query_job["eventCount"]),
             "result_count": int(query_job["resultCount"]),
         }
-        status = (
-            "\r%(done_progress)03.1f%%   %(scan_count)d scanned   "
-            "%(event_count)d matched   %(result_count)d results"
-        ) % stats
         if prev_progress == 0:
             progress = stats["done_progress"]
         else:
@@ -404,13 +423,34 @@ class SplunkDriver(DriverBase):
         progress_bar.update(progress)
 
         if stats["is_done"] == "1":
-            logger.info(status)
+            # defer formatting to the logging framework
+            logger.info(
+                "\r%(done_progress)03.1f%%   %(scan_count)d scanned   "
+                "%(event_count)d matched   %(result_count)d results",
+                stats,
+            )
             logger.info("Splunk job completed.")
             return True
         return False
 
     @staticmethod
-    def _retrieve_results(query_job, offset, page_size):
+    def _retrieve_page(query_job, page_offset, page_size):
+        """Retrieve and decode a single page of job results."""
+        kwargs_paginate = {
+            "count": page_size,
+            "offset": page_offset,
+            "output_mode": "json",
+        }
+        # Get the search results and display them
+        search_results = query_job.results(**kwargs_paginate)
+        # due to DeprecationWarning of normal ResultsReader
+        reader = sp_results.JSONResultsReader(  # pylint: disable=no-member
+            search_results
+        )
+        return [row for row in reader if isinstance(row, dict)], reader
+
+    @classmethod
+    def _retrieve_results(cls, query_job, offset, page_size):
         """Retrieve the results of a job, decode and return them."""
         # Retrieving all the results by paginate
         result_count = int(
@@ -418,24 +458,20 @@ class SplunkDriver(DriverBase):
         )  # Number of results this job returned
 
         resp_rows = []
+        reader = None
         progress_bar_paginate = tqdm(
             total=result_count, desc="Waiting Splunk result to retrieve"
         )
-        while offset < result_count:
-            kwargs_paginate = {
-                "count": page_size,
-                "offset": offset,
-                "output_mode": "json",
-            }
-            # Get the search results and display them
-            search_results = query_job.results(**kwargs_paginate)
-            # due to DeprecationWarning of normal ResultsReader
-            reader = sp_results.JSONResultsReader(  # pylint: disable=no-member
-                search_results
+        # Fetch the pages concurrently - each page is an independent
+        # offset/count request - and re-assemble them in offset order.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pages = executor.map(
+                partial(cls._retrieve_page, query_job, page_size=page_size),
+                range(offset, result_count, page_size),
             )
-            resp_rows.extend([row for row in reader if isinstance(row, dict)])
-            progress_bar_paginate.update(page_size)
-            offset += page_size
+            for page_rows, reader in pages:
+                resp_rows.extend(page_rows)
+                progress_bar_paginate.update(page_size)
         # Update progress bar indicating fetch results
         progress_bar_paginate.update(result_count)
         progress_bar_paginate.close()
@@ -468,19 +504,16 @@ class SplunkDriver(DriverBase):
         """
         if not self.connected:
             raise self._create_not_connected_err("Splunk")
-        savedsearches = self.service.saved_searches
-
-        out_df = pd.DataFrame(columns=["name", "query"])
-
-        namelist = []
-        querylist = []
-        for savedsearch in savedsearches:
-            namelist.append(savedsearch.name.replace(" ", "_"))
-            querylist.append(savedsearch["search"])
-        out_df["name"] = namelist
-        out_df["query"] = querylist
-
-        return out_df
+        return pd.DataFrame(
+            [
+                {
+                    "name": savedsearch.name.replace(" ", "_"),
+                    "query": savedsearch["search"],
+                }
+                for savedsearch in self._get_cached_saved_searches()
+            ],
+            columns=["name", "query"],
+        )
 
     @property
     def _fired_alerts(self) -> Union[pd.DataFrame, Any]:
@@ -507,19 +540,13 @@ class SplunkDriver(DriverBase):
         """
         if not self.connected:
             raise self._create_not_connected_err("Splunk")
-        firedalerts = self.service.fired_alerts
-
-        out_df = pd.DataFrame(columns=["name", "count"])
-
-        alert_names = []
-        alert_counts = []
-        for alert in firedalerts:
-            alert_names.append(alert.name)
-            alert_counts.append(alert.count)
-        out_df["name"] = alert_names
-        out_df["count"] = alert_counts
-
-        return out_df
+        return pd.DataFrame(
+            [
+                {"name": alert.name, "count": alert.count}
+                for alert in self.service.fired_alerts
+            ],
+            columns=["name", "count"],
+        )
 
     # Parameter Formatting methods
     @staticmethod
@@ -4,9 +4,12 @@
 #  license information.
 #  --------------------------------------------------------------------------
 """Sumologic Driver class."""
+import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from timeit import default_timer as timer
 from typing import Any, Dict, Optional, Tuple, Union
 
@@ -27,6 +30,8 @@ from .driver_base import DriverBase, DriverProps, QuerySource
 __version__ = VERSION
 __author__ = "juju4"
 
+logger = logging.getLogger(__name__)
+
 
 SUMOLOGIC_CONNECT_ARGS = {
     "connection_str": "(string) The url endpoint (the default is"
@@ -37,6 +42,40 @@ SUMOLOGIC_CONNECT_ARGS = {
 }
 
 _HELP_URI = "https://msticpy.readthedocs.io/en/latest/DataProviders.html"
+
+# Built-in metadata columns that are always numeric
+_NUMERIC_FIELDS = frozenset(
+    {"map._count", "map._collectorid", "map._messageid", "map._size"}
+)
+# Built-in metadata columns holding millisecond timestamps
+# https://help.sumologic.com/05Search/Get-Started-with-Search/Search-Basics/Built-in-Metadata
+# https://help.sumologic.com/05Search/Search-Query-Language/Search-Operators/timeslice
+_TIMESTAMP_FIELDS = frozenset(
+    {"map._receipttime", "map._messagetime", "map._timeslice"}
+)
+
+
+def _flatten_record(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dicts in `record`, joining keys with '.'."""
+    flat_record: Dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat_record.update(_flatten_record(value, name))
+        else:
+            flat_record[name] = value
+    return flat_record
+
+
+def _normalize_to_dataframe(results: Any) -> pd.DataFrame:
+    """Return a DataFrame of results with nested fields flattened."""
+    if isinstance(results, list) and all(isinstance(row, dict) for row in results):
+        # considerably faster than pd.json_normalize for the mostly-flat
+        # records returned by the search job API.
+        return pd.DataFrame([_flatten_record(row) for row in results])
+    return pd.json_normalize(results)
+
+
 _SL_NB_URI = (
     "https://github.com/microsoft/msticpy/blob/pr/116-sumologic"
     "-driver-2021-04-21/docs/notebooks/Sumologic-DataConnector.ipynb"
@@ -62,6 +101,8 @@ class SumologicDriver(DriverBase):
         self._loaded = True
         self._connected = False
         self._debug = kwargs.get("debug", False)
+        if self._debug:
+            logger.setLevel(logging.DEBUG)
         self.set_driver_property(DriverProps.PUBLIC_ATTRS, {"client": self.service})
         self.set_driver_property(
             DriverProps.FORMATTERS, {"datetime": self._format_datetime}
@@ -129,7 +170,7 @@ class SumologicDriver(DriverBase):
         self, connection_str: Optional[str], **kwargs
     ) -> Dict[str, Any]:
         """Check and consolidate connection parameters."""
-        cs_dict: Dict[str, Any] = self._CONNECT_DEFAULTS
+        cs_dict: Dict[str, Any] = dict(self._CONNECT_DEFAULTS)
         # Fetch any config settings
         settings, cs_is_instance_name = self._get_sumologic_settings(connection_str)
         cs_dict.update(settings)
@@ -332,27 +373,24 @@ class SumologicDriver(DriverBase):
                 print(f"DEBUG: Paging, total count {count}, limit {limit}")
             try:
                 job_limit = 10000
-                iterations = int(count / job_limit) + (count % job_limit > 0)
+                # Pre-compute the page offsets and dispatch the fetches
+                # to a small pool rather than paging serially.
+                offsets = range(0, count, job_limit)
+                fetch_page = partial(
+                    self.service.search_job_records, searchjob, limit=job_limit
+                )
                 total_results = []
-                for i in range(0, iterations):
-                    if i == iterations:
-                        job_limit2 = count - (iterations - 1) * job_limit
-                    else:
-                        job_limit2 = job_limit
-                    if verbosity >= 2:
-                        print(
-                            f"DEBUG: Paging {i * job_limit} / {count}, limit {job_limit2}"
-                        )
-                    result = self.service.search_job_records(
-                        searchjob, offset=(i * job_limit), limit=job_limit2
-                    )
-                    total_results.extend(result["records"])
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    for result in executor.map(
+                        lambda offset: fetch_page(offset=offset), offsets
+                    ):
+                        total_results.extend(result["records"])
                 return total_results
             except Exception as err:
                 self._raise_qry_except(
                     err,
                     "search_job_records",
-                    f"to get search records (paging i {i*job_limit} / {count})",
+                    f"to get search records (paging {count} records)",
                 )
 
     # pylint: disable=inconsistent-return-statements
@@ -478,38 +516,43 @@ class SumologicDriver(DriverBase):
         numeric_columns = kwargs.pop("numeric_columns", [])
 
         results = self._query(query, **kwargs)
-        if verbosity >= 3:
-            print("DEBUG: {results}")
+        # formatting the raw results is expensive - let the logging
+        # framework do it only if DEBUG output is enabled
+        logger.debug("query results: %s", results)
+        if not results:
+            # nothing to normalize, convert or export
+            print("Warning - query did not return any results.")
+            return pd.DataFrame()
         if normalize:
-            dataframe_res = pd.json_normalize(results)
+            dataframe_res = _normalize_to_dataframe(results)
         else:
             dataframe_res = pd.DataFrame(results)
 
         if limit is not None and dataframe_res.shape[0] > limit:
             dataframe_res = dataframe_res.head(limit)
 
-        for col in dataframe_res.columns:
-            try:
-                if (
-                    col
-                    in ["map._count", "map._collectorid", "map._messageid", "map._size"]
-                    + numeric_columns
-                ):
-                    dataframe_res[col] = pd.to_numeric(dataframe_res[col])
-                # ensure timestamp format
-                # https://help.sumologic.com/05Search/Get-Started-with-Search/Search-Basics/Built-in-Metadata
-                # https://help.sumologic.com/05Search/Search-Query-Language/Search-Operators/timeslice
-                if col in ("map._receipttime", "map._messagetime", "map._timeslice"):
-                    dataframe_res[col] = pd.to_datetime(dataframe_res[col], unit="ms")
-                if col in time_columns:
-                    dataframe_res[col] = pd.to_datetime(dataframe_res[col])
-
-            except Exception as err:
-                self._raise_qry_except(
-                    err,
-                    "query",
-                    f"query column type conversion: {col} -> {dataframe_res[col]}",
-                )
+        # intersect the column sets once rather than testing every
+        # result column against each field list
+        result_columns = set(dataframe_res.columns)
+        column_converters = [
+            (result_columns & _NUMERIC_FIELDS.union(numeric_columns), pd.to_numeric),
+            # ensure timestamp format
+            (
+                result_columns & _TIMESTAMP_FIELDS,
+                partial(pd.to_datetime, unit="ms"),
+            ),
+            (result_columns.intersection(time_columns), pd.to_datetime),
+        ]
+        for columns, converter in column_converters:
+            for col in columns:
+                try:
+                    dataframe_res[col] = converter(dataframe_res[col])
+                except Exception as err:
+                    self._raise_qry_except(
+                        err,
+                        "query",
+                        f"query column type conversion: {col} -> {dataframe_res[col]}",
+                    )
 
         if exporting:
             if export_path.endswith(".xlsx"):
@@ -521,7 +564,8 @@ class SumologicDriver(DriverBase):
                     print("DEBUG: Exporting results to csv file {export_path}")
                 dataframe_res.to_csv(export_path, index=False)
 
-        return dataframe_res.copy()
+        # dataframe_res is built locally - no need to return a copy
+        return dataframe_res
 
     def query_with_results(self, query: str, **kwargs) -> Tuple[pd.DataFrame, Any]:
         """
@@ -158,15 +158,15 @@ class LAUploader(UploaderBase):
             Custom number of rows to batch.
         """
         batch_size = kwargs.get("batch_size", 10000)  # Set a default batch size
-        events = []
-        for i, row in enumerate(data.iterrows()):
-            events.append(row[1].astype(str).to_dict())
-            if (i + 1) % batch_size == 0 or i == len(data) - 1:
-                body = json.dumps(events)
-                self._post_data(body, table_name)
-                events = []
-                if self._debug:
-                    print(f"Uploaded batch {i // batch_size + 1}")
+        # cast the whole frame to string once rather than row-by-row
+        str_data = data.astype(str)
+        for batch_idx, start in enumerate(range(0, len(str_data), batch_size)):
+            events = str_data.iloc[start : start + batch_size].to_dict(
+                orient="records"
+            )
+            self._post_data(json.dumps(events), table_name)
+            if self._debug:
+                print(f"Uploaded batch {batch_idx + 1}")
         if self._debug:
             print(f"Upload to {table_name} complete")
 
@@ -434,12 +434,11 @@ class PivotAccessor:
         """
         if isinstance(cols, str):
             cols = [cols]
-        data = self._df
-        for col in cols:
-            col_parsed = f"{col}_parsed"
-            data[col_parsed] = data[col].apply(_json_safe_conv)
-            data = data.drop([col], axis=1).rename(columns={col_parsed: col})
-        return data
+        # assign all parsed columns in one pass - this avoids the
+        # drop/rename copies of the full frame for each column
+        return self._df.assign(
+            **{col: self._df[col].apply(_json_safe_conv) for col in cols}
+        )
 
 
 def _name_match(cur_cols: Iterable[str], col_filter, match_case):
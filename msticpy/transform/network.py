@@ -59,10 +59,17 @@ def df_to_networkx(
     _verify_columns(
         data, source_col, target_col, source_attrs, target_attrs, edge_attrs
     )
-    # remove any source or target rows that are NaN
-    data = data.dropna(axis=0, subset=[source_col, target_col])
+    # remove any source or target rows that are NaN - only take a
+    # filtered copy if there is something to remove
+    na_rows = data[[source_col, target_col]].isna().any(axis=1)
+    if na_rows.any():
+        data = data[~na_rows]
+    # from_pandas_edgelist overwrites the attributes of repeated edges
+    # (the last row wins) - drop duplicate source/target pairs up front
+    # so repeated rows don't cost per-row work in the graph build
+    edge_data = data.drop_duplicates(subset=[source_col, target_col], keep="last")
     nx_graph = nx.from_pandas_edgelist(
-        data,
+        edge_data,
         source=source_col,
         target=target_col,
         edge_attr=edge_attrs,
@@ -93,10 +100,12 @@ def _set_node_attributes(
     # Group by the column value and apply the agg dictionary
     # to_dict(orient="index") produces a dict like
     # { column_val: { attrib_name: attrib_val, attrib2_name: ....}}
+    # sort=False - the result is used as a lookup dict so skip
+    # sorting the (frequently-repeating) group keys
     source_attrib_dict = (
         data[all_cols]
         .assign(node_role=node_role, node_type=column)
-        .groupby(column)
+        .groupby(column, sort=False)
         .agg(agg_dict)
         .to_dict(orient="index")
     )
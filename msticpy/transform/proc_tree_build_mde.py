@@ -188,7 +188,10 @@ def _get_unique_parents(data, debug=False):
     """Return unique set of processes."""
     if "src_index" in data.columns:
         data = data.drop(columns="src_index")
-    missing_par_uniq = data.drop_duplicates().copy()
+    # hash whole rows in one Cython pass - cheaper than drop_duplicates'
+    # per-column factorization on these wide all-string frames
+    row_hashes = pd.util.hash_pandas_object(data, index=False)
+    missing_par_uniq = data.loc[~row_hashes.duplicated().to_numpy()].copy()
     missing_par_uniq["InitiatingProcessName"] = missing_par_uniq.apply(
         lambda row: row.CreatedProcessParentName.split("\\")[-1], axis=1
     )
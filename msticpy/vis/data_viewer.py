@@ -65,8 +65,10 @@ class DataViewerBokeh:
             raise ValueError("No data available in 'data'")
 
         output_notebook(hide_banner=True)
-        # Drop empty columns
-        data = data.dropna(axis="columns", how="all")
+        # Drop empty columns - only copy the frame if there are any
+        empty_cols = data.isna().all()
+        if empty_cols.any():
+            data = data.loc[:, ~empty_cols]
         self.cds = ColumnDataSource(data)
         self._columns = _get_cols_from_df(data)
         self._dt_columns = list(self._columns.values())
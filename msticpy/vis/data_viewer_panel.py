@@ -82,8 +82,9 @@ class DataViewer:
         if data.empty:
             raise ValueError("No data available in 'data'")
 
-        # Drop empty columns
-        self.data = data.dropna(axis="columns", how="all")
+        # Drop empty columns - only copy the frame if there are any
+        empty_cols = data.isna().all()
+        self.data = data.loc[:, ~empty_cols] if empty_cols.any() else data
         # Set up hidden columns
         hidden_cols = kwargs.pop("hidden_cols", None)
         self._hidden_columns = self._default_hidden_cols(selected_cols, hidden_cols)
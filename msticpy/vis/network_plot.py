@@ -7,18 +7,17 @@
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import networkx as nx
+import numpy as np
 from bokeh.io import output_notebook
 from bokeh.models import (  # type: ignore[attr-defined]
-    BoxSelectTool,
     Circle,
+    ColumnDataSource,
     EdgesAndLinkedNodes,
     HoverTool,
-    Label,
+    LabelSet,
     MultiLine,
     NodesAndLinkedEdges,
     Renderer,
-    TapTool,
-    WheelZoomTool,
 )
 from bokeh.palettes import Spectral4
 from bokeh.plotting import figure, from_networkx, show
@@ -33,6 +32,18 @@ __author__ = "Ian Hellen"
 # wrap figure function to handle v2/v3 parameter renaming
 figure = bokeh_figure(figure)  # type: ignore[assignment, misc]
 
+_OUTPUT_NOTEBOOK_LOADED = False
+
+
+def _ensure_output_notebook():
+    """Load Bokeh notebook resources on the first plot only."""
+    # pylint: disable=global-statement
+    global _OUTPUT_NOTEBOOK_LOADED
+    # pylint: enable=global-statement
+    if not _OUTPUT_NOTEBOOK_LOADED:
+        output_notebook()
+        _OUTPUT_NOTEBOOK_LOADED = True
+
 
 GraphLayout = Union[
     Callable[[Any], Dict[str, Tuple[float, float]]],
@@ -111,6 +122,14 @@ def plot_nx_graph(
         The color of the source nodes, by default 'light-green'
     edge_color : str, optional
         The color of the edges, by default 'black'
+    output_backend : str, optional
+        The Bokeh rendering backend - "canvas" (the default), "webgl"
+        or "svg". "webgl" renders via the GPU and is much faster
+        for graphs with a large number of nodes and edges.
+    max_node_labels : int, optional
+        Maximum number of node labels to render, by default 1000.
+        Labels are omitted for graphs with more nodes than this -
+        node details are still available via the hover tool.
     kwargs :
         Additional keyword arguments are passed to the networkx
         layout function.
@@ -121,11 +140,13 @@ def plot_nx_graph(
         The network plot.
 
     """
-    output_notebook()
+    _ensure_output_notebook()
     font_pnt = f"{font_size}pt" if isinstance(font_size, int) else font_size
     source_color = kwargs.pop("source_color", "lightblue")
     target_color = kwargs.pop("target_color", "lightgreen")
     edge_color = kwargs.pop("edge_color", "black")
+    output_backend = kwargs.pop("output_backend", "canvas")
+    max_node_labels = kwargs.pop("max_node_labels", 1000)
     node_attrs = {
         node: attrs.get(
             "color",
@@ -144,8 +165,16 @@ def plot_nx_graph(
         y_range=(-3, 3),
         width=width,
         height=height,
+        output_backend=output_backend,
+        tools="pan,wheel_zoom,box_zoom,tap,box_select,reset,save,help",
     )
 
+    if not len(nx_graph):
+        # empty graph - nothing to lay out or render
+        if not hide:
+            show(plot)
+        return plot
+
     nx_graph_for_plotting = nx.Graph()
     index_node = 0
     rev_index = {}
@@ -163,6 +192,13 @@ def plot_nx_graph(
     for source_node, target_node in nx_graph.edges:
         nx_graph_for_plotting.add_edge(rev_index[source_node], rev_index[target_node])
 
+    if isinstance(layout, dict):
+        # remap precomputed positions to the renumbered node ids
+        layout = {
+            rev_index[node]: position
+            for node, position in layout.items()
+            if node in rev_index
+        }
     graph_layout = _get_graph_layout(nx_graph_for_plotting, layout, **kwargs)
 
     graph_renderer = from_networkx(
@@ -183,33 +219,81 @@ def plot_nx_graph(
         hover_tools.append(
             _create_edge_hover(edge_attrs, [graph_renderer.edge_renderer])
         )
-    plot.add_tools(*hover_tools, WheelZoomTool(), TapTool(), BoxSelectTool())
+    plot.add_tools(*hover_tools)
 
     # Create labels
+    # use a single LabelSet rather than a Label annotation per node -
+    # one renderer model regardless of the number of nodes
     # pylint: disable=no-member
-    for index, pos in graph_renderer.layout_provider.graph_layout.items():
-        label = Label(
-            x=pos[0],
-            y=pos[1],
+    layout_positions = graph_renderer.layout_provider.graph_layout
+    if len(layout_positions) <= max_node_labels:
+        # float32 is ample precision for screen positions and halves
+        # the serialized payload vs float64
+        coords = np.fromiter(
+            (coord for position in layout_positions.values() for coord in position),
+            dtype=np.float32,
+            count=2 * len(layout_positions),
+        ).reshape(-1, 2)
+        label_source = ColumnDataSource(
+            data={
+                "x": coords[:, 0],
+                "y": coords[:, 1],
+                "node_label": [fwd_index[int(index)] for index in layout_positions],
+            }
+        )
+        labels = LabelSet(
+            x="x",
+            y="y",
             x_offset=5,
             y_offset=5,
-            text=fwd_index[int(index)],
+            text="node_label",
             text_font_size=font_pnt,
+            source=label_source,
         )
-        plot.add_layout(label)
+        plot.add_layout(labels)
     if not hide:
         show(plot)
     return plot
 
 
+# Cached positions for named layouts, keyed by layout name, graph
+# topology and layout kwargs. Force-directed layouts dominate plot time
+# so re-plotting an unchanged graph re-uses the computed positions.
+_LAYOUT_CACHE: Dict[Any, Dict[Any, Tuple[float, float]]] = {}
+_LAYOUT_CACHE_MAX = 10
+
+
 def _get_graph_layout(nx_graph: nx.Graph, layout: GraphLayout, **kwargs):
     """Return a layout for the graph."""
+    if isinstance(layout, dict):
+        # precomputed positions - no layout computation needed
+        return layout
     if callable(layout):
         return layout(nx_graph, **kwargs)
+    try:
+        cache_key: Optional[Tuple] = (
+            layout,
+            frozenset(nx_graph.nodes()),
+            frozenset(nx_graph.edges()),
+            tuple(sorted(kwargs.items())),
+        )
+        hash(cache_key)
+    except TypeError:
+        # unhashable layout or kwargs - just compute the layout
+        cache_key = None
+    if cache_key is not None and cache_key in _LAYOUT_CACHE:
+        return _LAYOUT_CACHE[cache_key]
     layout_func = getattr(nx, f"{layout}_layout", None)
-    if layout_func:
-        return layout_func(nx_graph, **kwargs)
-    return nx.spring_layout(nx_graph, **kwargs)
+    graph_layout = (
+        layout_func(nx_graph, **kwargs)
+        if layout_func
+        else nx.spring_layout(nx_graph, **kwargs)
+    )
+    if cache_key is not None:
+        if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_MAX:
+            _LAYOUT_CACHE.clear()
+        _LAYOUT_CACHE[cache_key] = graph_layout
+    return graph_layout
 
 
 def _create_node_hover(
@@ -298,7 +382,7 @@ def plot_entity_graph(
         The network plot.
 
     """
-    output_notebook()
+    _ensure_output_notebook()
     font_pnt = f"{font_size}pt" if isinstance(font_size, int) else font_size
     node_attrs = {
         node: attrs.get("color", "green")
@@ -334,17 +418,26 @@ def plot_entity_graph(
     # pylint: disable=no-member
     plot.renderers.append(graph_renderer)  # type: ignore[attr-defined]
 
-    # Create labels
-    for name, pos in graph_renderer.layout_provider.graph_layout.items():
-        label = Label(
-            x=pos[0],
-            y=pos[1],
-            x_offset=5,
-            y_offset=5,
-            text=str(name),
-            text_font_size=font_pnt,
-        )
-        plot.add_layout(label)
+    # Create labels - a single LabelSet is one renderer model
+    # regardless of the number of nodes
+    layout_positions = graph_renderer.layout_provider.graph_layout
+    label_source = ColumnDataSource(
+        data={
+            "x": [pos[0] for pos in layout_positions.values()],
+            "y": [pos[1] for pos in layout_positions.values()],
+            "node_label": [str(name) for name in layout_positions],
+        }
+    )
+    labels = LabelSet(
+        x="x",
+        y="y",
+        x_offset=5,
+        y_offset=5,
+        text="node_label",
+        text_font_size=font_pnt,
+        source=label_source,
+    )
+    plot.add_layout(labels)
     # pylint: enable=no-member
     if not hide:
         show(plot)
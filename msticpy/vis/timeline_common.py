@@ -7,6 +7,7 @@
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from bokeh.models import (  # type: ignore[attr-defined]
     ColumnDataSource,
@@ -132,13 +133,20 @@ def create_data_grouping(
         # Shift the Viridis palette so we lose the top, harder-to-see colors
         series_count = len(group_count_df)
         colors, palette_size = get_color_palette(series_count)
-        group_count_df["color"] = group_count_df.apply(
-            lambda x: colors[x.y_index % palette_size], axis=1
+        # vectorized palette lookup rather than a per-row apply
+        group_count_df["color"] = np.take(
+            colors, group_count_df["y_index"] % palette_size
         )
-        # re-join with the original data
+        # re-join with the original data - mapping from the group key
+        # is faster than a merge for this many-to-one lookup
         data_columns.update([group_by, "y_index", "color"])
         clean_data = data.drop(columns=["y_index", "color"], errors="ignore")
-        graph_df = clean_data.merge(group_count_df, on=group_by)[list(data_columns)]
+        clean_data = clean_data[clean_data[group_by].notna()]
+        group_lookup = group_count_df.set_index(group_by)
+        graph_df = clean_data.assign(
+            y_index=clean_data[group_by].map(group_lookup["y_index"]),
+            color=clean_data[group_by].map(group_lookup["color"]),
+        )[list(data_columns)]
     else:
         graph_df = data[list(data_columns)].copy()
         graph_df["color"] = color
@@ -365,11 +373,16 @@ def plot_ref_events(
     if ref_events is not None:
         if isinstance(ref_events, pd.Series):
             ref_events = pd.DataFrame(ref_events)
-        for idx, event in enumerate(ref_events.itertuples()):
-            evt_time = event._asdict()[time_col]
-            evt_label = (
-                event._asdict()[ref_col] if ref_col else f"reference {event.Index}"
-            )
+        # read the two columns needed directly rather than building
+        # a dict of every column for each row
+        evt_labels = (
+            ref_events[ref_col]
+            if ref_col
+            else [f"reference {index}" for index in ref_events.index]
+        )
+        for idx, (evt_time, evt_label) in enumerate(
+            zip(ref_events[time_col], evt_labels)
+        ):
             plot_ref_line(
                 plot=plot,
                 ref_time=evt_time,
@@ -161,8 +161,21 @@ def display_timeline_duration(
 
     # Create Bokeh Column Data Sources
     col_src = ColumnDataSource(grouped_data)
-    # Re-join original data to grouped data
-    all_data = data.merge(grouped_data, on=group_by)
+    # Re-join original data to grouped data - reindexing the grouped
+    # frame on the group keys is cheaper than a merge for this
+    # many-to-one lookup
+    valid_rows = data[group_by].notna().all(axis=1)
+    plot_data = data.loc[valid_rows].reset_index(drop=True)
+    group_keys = (
+        pd.MultiIndex.from_frame(plot_data[group_by])
+        if len(group_by) > 1
+        else pd.Index(plot_data[group_by[0]])
+    )
+    group_lookup = grouped_data.set_index(group_by)
+    all_data = pd.concat(
+        [plot_data, group_lookup.reindex(group_keys).reset_index(drop=True)],
+        axis=1,
+    )
     all_data_src = ColumnDataSource(all_data)
 
     tool_tip_cols = [*group_by, "start_time", "end_time"]
@@ -262,9 +275,9 @@ def _group_durations(
         end_time=pd.NamedAgg(end_time_column, "max"),
     )
     # If we don't have an endtime for certain types just consider them to be single time events
-    for row in grouped_data.iterrows():
-        if pd.isnull(row[1]["end_time"]):
-            grouped_data.at[row[0], "end_time"] = row[1]["start_time"]
+    grouped_data["end_time"] = grouped_data["end_time"].fillna(
+        grouped_data["start_time"]
+    )
     grouped_data = grouped_data.reset_index()
     grouped_data.index.name = "Row"
     grouped_data = grouped_data.reset_index()
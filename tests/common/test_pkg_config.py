@@ -14,6 +14,7 @@ import pytest_check as check
 import yaml
 
 from msticpy.common import pkg_config
+from msticpy.common.provider_settings import get_provider_settings
 from msticpy.context.geoip import GeoLiteLookup, IPStackLookup
 
 from ..unit_test_lib import custom_mp_config, get_test_data_path
@@ -240,3 +241,17 @@ def test_set_config(key, value, create, expected):
             result = pkg_config.set_config(key, value, create)
     if result:
         check.equal(result, expected)
+
+
+def test_provider_settings_cache_invalidation():
+    """Test provider settings cache is invalidated by set_config."""
+    test_config = get_test_data_path().parent.joinpath("msticpyconfig-test.yaml")
+    with custom_mp_config(test_config):
+        initial = get_provider_settings("TIProviders")
+        # unchanged config - the cached settings are returned
+        check.is_true(get_provider_settings("TIProviders") is initial)
+        # in-place config update - settings must be rebuilt
+        pkg_config.set_config("TIProviders.OTX.Args.AuthKey", "new-auth-key")
+        updated = get_provider_settings("TIProviders")
+        check.is_false(updated is initial)
+        check.equal(updated["OTX"].args["AuthKey"], "new-auth-key")
@@ -6,11 +6,12 @@
 """Miscellaneous data provider driver tests."""
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 import pytest_check as check
 
 from msticpy.data import DataEnvironment, QueryProvider
-from msticpy.data.drivers import import_driver
+from msticpy.data.drivers import import_driver, odata_driver
 from msticpy.data.drivers.mdatp_driver import MDATPDriver
 from msticpy.data.drivers.security_graph_driver import SecurityGraphDriver
 
@@ -206,3 +207,43 @@ def test_ResourceGraph():
     driver_cls = import_driver(DataEnvironment.ResourceGraph)
     resource_graph = driver_cls()
     assert isinstance(resource_graph, ResourceGraphDriver)
+
+
+_RESULT_RECORD_TESTS = [
+    pytest.param(
+        [
+            {"alertId": "1", "severity": "high"},
+            {"alertId": "2", "severity": "low"},
+        ],
+        id="flat",
+    ),
+    pytest.param(
+        [
+            {"alertId": "1", "evidence": {"ip": "10.0.0.1"}},
+            {"alertId": "2", "evidence": {"ip": "10.0.0.2"}},
+        ],
+        id="nested",
+    ),
+    pytest.param(
+        [
+            {"alertId": "1", "severity": "high"},
+            {"alertId": "2", "evidence": {"ip": "10.0.0.2"}},
+        ],
+        id="mixed-flat-first",
+    ),
+    pytest.param(
+        [
+            {"alertId": "1", "devices": ["host1", "host2"]},
+            {"alertId": "2", "devices": []},
+        ],
+        id="list-values",
+    ),
+    pytest.param([], id="empty"),
+]
+
+
+@pytest.mark.parametrize("records", _RESULT_RECORD_TESTS)
+def test_odata_results_to_dataframe(records):
+    """Test fast-path DataFrame conversion matches json_normalize."""
+    result = odata_driver._results_to_dataframe(records)
+    pd.testing.assert_frame_equal(result, pd.json_normalize(records))
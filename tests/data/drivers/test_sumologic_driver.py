@@ -22,7 +22,10 @@ from msticpy.common.exceptions import (
     MsticpyUserConfigError,
     MsticpyUserError,
 )
-from msticpy.data.drivers.sumologic_driver import SumologicDriver
+from msticpy.data.drivers.sumologic_driver import (
+    SumologicDriver,
+    _normalize_to_dataframe,
+)
 
 from ...unit_test_lib import TEST_DATA_PATH
 
@@ -254,7 +257,7 @@ _QUERY_TESTS = [
     ("RecordFail", "Failed to get job messages: Message job failed"),
     (
         "RecordFail | count records",
-        "Failed to get search records (paging i 0 / 10): Record job failed",
+        "Failed to get search records (paging 10 records): Record job failed",
     ),
     ("Timeout", 0),
     ("Failjob", "Sumologic submit search_job"),
@@ -364,6 +367,39 @@ def test_sumologic_query_export(sumologic_drv, tmpdir, ext):
     check.is_true(Path(f_path).is_file())
 
 
+_NORMALIZE_TESTS = [
+    pytest.param(
+        [
+            {"map": {"_count": "1", "host": "h1"}},
+            {"map": {"_count": "2", "host": "h2"}},
+        ],
+        id="nested",
+    ),
+    pytest.param(
+        [
+            {"map": {"_count": "1", "meta": {"src": "s1", "ids": [1, 2]}}},
+            {"map": {"_count": "2", "meta": {"src": "s2", "ids": []}}},
+        ],
+        id="deep-nested",
+    ),
+    pytest.param(
+        [
+            {"TimeGenerated": "2021-01-01", "host": "h1"},
+            {"TimeGenerated": "2021-01-02", "host": "h2"},
+        ],
+        id="flat",
+    ),
+    pytest.param([], id="empty"),
+]
+
+
+@pytest.mark.parametrize("records", _NORMALIZE_TESTS)
+def test_sumologic_normalize_to_dataframe(records):
+    """Check flattened results match pandas json_normalize output."""
+    result = _normalize_to_dataframe(records)
+    pd.testing.assert_frame_equal(result, pd.json_normalize(records))
+
+
 # @pytest.mark.skip
 # def test_live_connect():
 #     """Use this to do live testing."""